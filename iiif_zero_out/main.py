@@ -10,12 +10,14 @@ def runner(config: models.ZeroOutConfig) -> int:
 
     logging.basicConfig(format="%(asctime)s %(message)s", level=logging.INFO)
 
-    converter = models.ZeroOutConfig(config=config)
-
-    if converter.config.clean:
-        converter.clean()
-    converter.initialize_images()
-    converter.create()
+    converter = models.ZeroConverter(config=config)
+
+    try:
+        if converter.config.clean:
+            converter.clean()
+        converter.run()
+    finally:
+        converter.close()
 
     return 0
 
@@ -1,19 +1,151 @@
-import argparse
 import json
 import logging
-import math
+import os
 import shutil
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from email.utils import formatdate, mktime_tz, parsedate_tz
+from functools import cached_property, lru_cache
+from itertools import product
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
 from pathlib import Path
 
 from tqdm import tqdm
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydantic import BaseModel, Field, AnyUrl, PrivateAttr, FilePath, DirectoryPath
 
 from iiif_zero_out.settings import settings
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster drop-in for the json module
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(data: bytes) -> Any:
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    if orjson is None:
+        return json.dumps(obj).encode()
+    return orjson.dumps(obj)
+
+
+def level0_info() -> dict:
+    """
+    info.json fields that are the same for every Level 0 image we write. Built fresh on each call so that no two images share the nested profile objects.
+    """
+    return {
+        "@context": "http://iiif.io/api/image/2/context.json",
+        "profile": [
+            "http://iiif.io/api/image/2/level0.json",
+            {"formats": ["jpg"], "qualities": ["default"]},
+        ],
+        "protocol": "http://iiif.io/api/image",
+    }
+
+
+# Optional source info.json fields copied as-is into the translated info.json
+PASSTHROUGH_INFO_KEYS = ("maxWidth", "maxHeight")
+
+
+def new_session(pool_maxsize: int = 10) -> requests.Session:
+    """
+    Build a Session that keeps connections to the IIIF endpoint alive between requests and retries transient server errors.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=settings.RETRIES,
+            backoff_factor=settings.RETRY_BACKOFF,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Default session for images and tiles used on their own rather than through a ZeroConverter
+SESSION = new_session()
+
+
+def progress(iterable: Iterable, total: int) -> tqdm:
+    """
+    Progress bar that redraws at most every 0.1% of items or quarter second, so terminal output doesn't dominate loops of quick iterations.
+    """
+    return tqdm(
+        iterable,
+        total=total,
+        leave=False,
+        miniters=max(1, total // 1000),
+        mininterval=0.25,
+    )
+
+
+@lru_cache(maxsize=None)
+def scaling_factors_up_to(max_factor: int) -> tuple[int, ...]:
+    return tuple(sf for sf in settings.BASE_SCALING_FACTORS if sf <= max_factor)
+
+
+@lru_cache(maxsize=None)
+def smaller_sizes_below(width: int) -> tuple[int, ...]:
+    return tuple(s for s in settings.BASE_SMALLER_SIZES if s < width)
+
+
+@lru_cache(maxsize=None)
+def size_string(size_w: Optional[int], size_h: Optional[int]) -> str:
+    """
+    IIIF size parameter for a width and height. Most tiles of an image share a handful of sizes, so the strings are interned rather than rebuilt per tile.
+    """
+    if size_w is None and size_h is None:
+        return "full"
+    str_size_w: str = "" if size_w is None else str(size_w)
+    str_size_h: str = "" if size_h is None else str(size_h)
+    return f"{str_size_w},{str_size_h}"
+
+
+def fetch_source_info(url: str, session: Optional[requests.Session] = None) -> dict:
+    """
+    Request and parse a source info.json
+    """
+    response = (session or SESSION).get(url, timeout=settings.TIMEOUT)
+    if response.status_code != 200:
+        raise Exception(f"{response.status_code}: {response.content}")
+    return json_loads(response.content)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write to a temporary file first and move it into place, so an interrupted run can't leave behind a truncated file
+    """
+    partial = path.with_name(f"{path.name}.part")
+    partial.write_bytes(data)
+    os.replace(partial, path)
+
+
+def tile_spans(length: int, cropsize: int) -> list[tuple[int, int]]:
+    """
+    Split one dimension of an image into (offset, length) spans of cropsize, with a shorter final span for any remainder.
+    """
+    return [(o, min(cropsize, length - o)) for o in range(0, length, cropsize)]
+
+
+@dataclass(frozen=True)
+class BBox:
+    """
+    Region and size parameters of a IIIF Image API request. Instances are immutable, so the derived strings and paths are computed once and cached.
+    """
 
-class BBox(BaseModel):
     region_x: Optional[int] = None
     region_y: Optional[int] = None
     region_w: Optional[int] = None
@@ -21,30 +153,27 @@ class BBox(BaseModel):
     size_w: Optional[int] = None
     size_h: Optional[int] = None
 
-    @property
+    @cached_property
     def region_string(self) -> str:
         if self.region_x is None:
             return "full"
         return f"{self.region_x},{self.region_y},{self.region_w},{self.region_h}"
 
-    @property
+    @cached_property
     def size_string(self) -> str:
-        if self.size_w is None and self.size_h is None:
-            return "full"
-        str_size_w: str = "" if self.size_w is None else str(self.size_w)
-        str_size_h: str = "" if self.size_h is None else str(self.size_h)
-        return f"{str_size_w},{str_size_h}"
+        return size_string(self.size_w, self.size_h)
 
-    @property
+    @cached_property
     def url(self) -> str:
         return f"{self.region_string}/{self.size_string}"
 
-    @property
+    @cached_property
     def path(self) -> Path:
-        return Path(self.region_string) / Path(self.size_string)
+        return Path(self.region_string, self.size_string)
 
 
-class IIIFTile(BaseModel):
+@dataclass(frozen=True)
+class IIIFTile:
     """
     An individual tile that has both a parent IIIFImage, as well as a local filepath to be created from that downloaded image.
     """
@@ -53,41 +182,119 @@ class IIIFTile(BaseModel):
     image_path: Path
     bbox: BBox
 
-    @property
+    @cached_property
+    def rel_path(self) -> str:
+        """
+        Path of the tile image relative to its parent image directory, in POSIX form
+        """
+        return f"{self.bbox.url}/0/default.jpg"
+
+    @cached_property
     def url(self) -> str:
-        return f"{self.image_source_url}/{self.bbox.url}/0/default.jpg"
+        return f"{self.image_source_url}/{self.rel_path}"
 
-    @property
+    @cached_property
     def path(self) -> Path:
-        return self.image_path / self.bbox.path / "0/default.jpg"
+        return self.image_path / self.rel_path
 
-    @property
+    @cached_property
     def dir(self) -> Path:
         """
         Immediate parent directory
         """
         return self.path.parent
 
-    @property
+    @cached_property
     def top_path(self) -> Path:
         """
         Top-level parent directory for this tile
         """
-        return self.image_path / self.bbox.path.parts[0]
+        return self.image_path / self.bbox.region_string
 
     @property
     def exists(self) -> bool:
-        return self.path.exists()
+        return os.path.exists(self.path)
 
-    def create(self) -> None:
+    def partial_path(self) -> Path:
+        """
+        Temporary file a tile is downloaded into before being moved into place. Unique to the writing thread, so two downloads of the same tile never write into one file.
+        """
+        return self.path.with_name(
+            f"{self.path.name}.{os.getpid()}-{threading.get_ident()}.part"
+        )
+
+    def request(
+        self, session: Optional[requests.Session] = None, **kwargs
+    ) -> requests.Response:
+        return (session or SESSION).get(
+            self.url, stream=True, timeout=settings.TIMEOUT, **kwargs
+        )
+
+    def save(self, response: requests.Response, img: BinaryIO) -> None:
+        # Copy the body straight to disk without holding the whole JPEG in memory
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, img, settings.CHUNK_SIZE)
+
+    def download(self, response: requests.Response) -> None:
+        """
+        Write a tile's response body to a temporary file and then atomically move it into place, so an interrupted download never leaves a truncated tile that would be mistaken for a finished one
+        """
+        # Fail before touching the disk, so an error response leaves no files or directories behind
+        if response.status_code != 200:
+            raise Exception(f"{response.status_code}: {self.url}")
+        partial = self.partial_path()
+        try:
+            try:
+                img = partial.open("wb")
+            except FileNotFoundError:
+                # Only create parent directories if the first attempt finds them missing
+                self.dir.mkdir(parents=True, exist_ok=True)
+                img = partial.open("wb")
+            with img:
+                self.save(response, img)
+            self.stamp(partial, response)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        os.replace(partial, self.path)
+
+    @staticmethod
+    def stamp(path: Path, response: requests.Response) -> None:
+        """
+        Set a downloaded tile's modification time to the server's Last-Modified date, so that revalidating it later asks the server about its own timestamp rather than our local clock
+        """
+        parsed = parsedate_tz(response.headers.get("Last-Modified", ""))
+        if parsed is not None:
+            last_modified = mktime_tz(parsed)
+            os.utime(path, (last_modified, last_modified))
+
+    def create(
+        self, session: Optional[requests.Session] = None, refresh: bool = False
+    ) -> None:
         if self.exists:
+            if refresh:
+                self.revalidate(session=session)
             return None
-        self.dir.mkdir(parents=True, exist_ok=True)
-        response = requests.get(self.url)
-        if response.status_code != 200:
-            raise Exception
-        with self.path.open("wb") as img:
-            img.write(response.content)
+        self.fetch(session=session)
+
+    def fetch(self, session: Optional[requests.Session] = None) -> None:
+        """
+        Download the tile without first checking whether it exists, for callers that have already found it missing
+        """
+        response = self.request(session)
+        with response:
+            self.download(response)
+
+    def revalidate(self, session: Optional[requests.Session] = None) -> None:
+        """
+        Re-download an existing tile only if the IIIF endpoint reports that it has changed since the tile was written
+        """
+        written = formatdate(self.path.stat().st_mtime, usegmt=True)
+        response = self.request(session, headers={"If-Modified-Since": written})
+        with response:
+            if response.status_code == 304:
+                return None
+            self.download(response)
 
     def clean(self) -> None:
         if self.exists:
@@ -105,82 +312,55 @@ class IIIFImage(BaseModel):
     tile_size: int
     source_url: str
     identifier: str
-    custom_tile_boxes: list[BBox] = []
+    custom_tile_boxes: list[BBox] = Field(default_factory=list)
     initialized: bool = False
-    info: dict = {}
-    tiles: list[IIIFTile] = []
+    info: dict = Field(default_factory=dict)
+    tiles: list[IIIFTile] = Field(default_factory=list)
 
     @property
     def info_exists(self) -> bool:
         return bool(self.info)
 
     @classmethod
-    def get_scaling_factors(cls, min_dim: int, tile_size: int) -> list[int]:
+    def get_scaling_factors(cls, min_dim: int, tile_size: int) -> tuple[int, ...]:
         """
         Determine which scaling factors, used in the creation of partial tiles, should be created based on the original dimensions of the image.
         """
-
-        return [
-            sf for sf in settings.BASE_SCALING_FACTORS if sf <= min_dim // tile_size
-        ]
+        # Only the quotient matters, so images of similar size share a cache entry
+        return scaling_factors_up_to(min_dim // tile_size)
 
     @classmethod
-    def get_downsizing_levels(cls, width: int) -> list[int]:
+    def get_downsizing_levels(cls, width: int) -> tuple[int, ...]:
         """
         Determine which series of small version of the image (to be used when zoomed out) should be downloaded.
 
         Requires requesting the original endpoint's info.json.
         """
-        return [s for s in settings.BASE_SMALLER_SIZES if s < width]
+        # Every width beyond the largest smaller size yields the same levels
+        return smaller_sizes_below(min(width, max(settings.BASE_SMALLER_SIZES) + 1))
 
     def init_default_tiles(self) -> None:
         scaling_factors = IIIFImage.get_scaling_factors(
             min_dim=self.min_dim, tile_size=self.tile_size
         )
+        # Loop invariants: self.path builds a new Path on every access
+        image_path = self.path
+        source_url = self.source_url
+        width, height, tile_size = (
+            self.info["width"],
+            self.info["height"],
+            self.tile_size,
+        )
+        extend_tiles = self.tiles.extend
         for sf in scaling_factors:
-            cropsize = self.tile_size * sf
-            full_widths = [
-                (i * cropsize, cropsize, math.ceil(cropsize / sf))
-                for i in range(
-                    0,
-                    self.info["width"] // cropsize,
-                )
-            ]
-            remainder_width = self.info["width"] % cropsize
-            if remainder_width > 0:
-                full_widths.append(
-                    (
-                        self.info["width"] - remainder_width,
-                        remainder_width,
-                        math.ceil(remainder_width / sf),
-                    )
-                )
-
-            full_heights = [
-                (i * cropsize, cropsize)
-                for i in range(0, self.info["height"] // cropsize)
-            ]
-            remainder_height = self.info["height"] % cropsize
-            if remainder_height > 0:
-                full_heights.append(
-                    (self.info["height"] - remainder_height, remainder_height)
-                )
-
-            for x in full_widths:
-                for y in full_heights:
-                    bb = BBox(
-                        region_x=x[0],
-                        region_y=y[0],
-                        region_w=x[1],
-                        region_h=y[1],
-                        size_w=x[2],
-                    )
-                    tile = IIIFTile(
-                        image_path=self.path,
-                        image_source_url=self.source_url,
-                        bbox=bb,
-                    )
-                    self.tiles.append(tile)
+            cropsize = tile_size * sf
+            # -(-w // sf) is ceil(w / sf) in integer arithmetic
+            columns = [(x, w, -(-w // sf)) for x, w in tile_spans(width, cropsize)]
+            rows = tile_spans(height, cropsize)
+            extend_tiles(
+                IIIFTile(source_url, image_path, BBox(x, y, w, h, size_w))
+                for (x, w, size_w), (y, h) in product(columns, rows)
+            )
 
     def init_fullsized_version(self) -> None:
         fullsize_tile = IIIFTile(
@@ -190,95 +370,110 @@ class IIIFImage(BaseModel):
 
     def init_downsized_versions(self) -> None:
         ds_levels = IIIFImage.get_downsizing_levels(width=self.info["width"])
+        image_path = self.path
         for ds in ds_levels:
             downsized_tile = IIIFTile(
                 image_source_url=self.source_url,
-                image_path=self.path,
+                image_path=image_path,
                 bbox=BBox(size_w=ds),
             )
             self.tiles.append(downsized_tile)
 
     def init_custom_tiles(self) -> None:
+        image_path = self.path
         for custom_tile in self.custom_tile_boxes:
             tile = IIIFTile(
-                image_path=self.path,
+                image_path=image_path,
                 image_source_url=self.source_url,
                 bbox=custom_tile,
             )
             self.tiles.append(tile)
 
     def translate_info(self, input: dict) -> dict:
-
+        width, height = input["width"], input["height"]
         new_info = {
-            "@context": "http://iiif.io/api/image/2/context.json",
+            **level0_info(),
             "@id": f"{self.converter_domain}/{self.identifier}",
-            "profile": [
-                "http://iiif.io/api/image/2/level0.json",
-                {"formats": ["jpg"], "qualities": ["default"]},
-            ],
-            "protocol": "http://iiif.io/api/image",
             "sizes": [
                 {"width": ds, "height": "full"}
-                for ds in IIIFImage.get_downsizing_levels(width=input["width"])
+                for ds in IIIFImage.get_downsizing_levels(width=width)
             ],
             "tiles": [
                 {
-                    "scaleFactors": IIIFImage.get_scaling_factors(
-                        min_dim=min(input["width"], input["height"]),
-                        tile_size=self.tile_size,
+                    "scaleFactors": list(
+                        IIIFImage.get_scaling_factors(
+                            min_dim=min(width, height),
+                            tile_size=self.tile_size,
+                        )
                     ),
                     "width": self.tile_size,
                 }
             ],
-            "width": input["width"],
-            "height": input["height"],
+            "width": width,
+            "height": height,
         }
 
-        if "maxWidth" in input:
-            new_info["maxWidth"] = input["maxWidth"]
-        if "maxHeight" in input:
-            new_info["maxHeight"] = input["maxHeight"]
+        for key in PASSTHROUGH_INFO_KEYS:
+            if key in input:
+                new_info[key] = input[key]
 
         return new_info
 
-    def get_info(self) -> None:
+    def get_info(self, session: Optional[requests.Session] = None) -> None:
+        if self.info_exists:
+            return None
         self.make_dir()
-        if not self.info_path.exists():
-            with self.info_path.open("wb") as info_file:
-                response = requests.get(self.source_info_url)
-                if response.status_code != 200:
-                    raise Exception(f"{response.status_code}: {response.content}")
-                # Rewrite file to new specifications
-                self.info = self.translate_info(response.json())
-                with self.info_path.open("w") as info_file:
-                    json.dump(self.info, info_file)
-        with self.info_path.open("r") as info_file:
-            self.info = json.load(info_file)
-
-    def prune(self) -> None:
-        """
-        Remove any images not needed in the specification
-        """
-        target_paths: list[Path] = [t.path for t in self.tiles]
-        for p in self.path.glob("**/*.jpg"):
-            if p not in target_paths:
-                p.unlink()
+        try:
+            self.info = json_loads(self.info_path.read_bytes())
+            return None
+        except FileNotFoundError:
+            pass
+        # Rewrite file to new specifications
+        self.info = self.translate_info(
+            fetch_source_info(self.source_info_url, session)
+        )
+        write_atomic(self.info_path, json_dumps(self.info))
+
+    def write_manifest(self) -> None:
+        """
+        Write the translated info.json along with every tile's relative path into one manifest.json, so downstream readers can list this image's tiles without walking its directory
+        """
+        manifest = {"info": self.info, "tiles": [t.rel_path for t in self.tiles]}
+        write_atomic(self.manifest_path, json_dumps(manifest))
+
+    def prune(
+        self,
+        existing: Optional[set[str]] = None,
+        partials: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Remove any images not needed in the specification, along with temporary .part files left behind by interrupted runs
+        """
+        if existing is None:
+            partials = []
+            existing = self.existing_tiles(partials)
+        target_paths: set[str] = {t.rel_path for t in self.tiles}
+        for rel_path in existing - target_paths:
+            (self.path / rel_path).unlink()
+        for rel_path in partials or []:
+            (self.path / rel_path).unlink(missing_ok=True)
 
     def clean(self) -> None:
         """
         Clean this image's whole directory
         """
         shutil.rmtree(self.path)
+        self.info = {}
 
     @property
     def min_dim(self) -> int:
-        if self.info is None:
+        if not self.info:
             raise Exception("Info not loaded yet")
         return min(self.info["width"], self.info["height"])
 
     @property
     def max_dim(self) -> int:
-        if self.info is None:
+        if not self.info:
             raise Exception("Info not loaded yet")
         return max(self.info["width"], self.info["height"])
 
@@ -298,6 +493,10 @@ class IIIFImage(BaseModel):
     def info_path(self) -> Path:
         return self.path / "info.json"
 
+    @property
+    def manifest_path(self) -> Path:
+        return self.path / "manifest.json"
+
     @property
     def json(self) -> str:
         return f"{self.url}/info.json"
@@ -311,38 +510,156 @@ class IIIFImage(BaseModel):
         """
         Have all the image tiles as well as the info.json file for this image been created?
         """
-        tiles_created: bool = all(t.exists for t in self.tiles)
+        existing = self.existing_tiles()
+        tiles_created: bool = all(t.rel_path in existing for t in self.tiles)
         return tiles_created and self.info_exists
 
-    def initialize_children(self) -> None:
-        self.get_info()
+    def initialize_children(self, session: Optional[requests.Session] = None) -> None:
+        self.get_info(session=session)
+        self.init_children()
+
+    def init_children(self) -> None:
+        """
+        Build the list of tiles from the already loaded info.json. Makes no requests, so it can run after the info has been fetched elsewhere.
+        """
+        # Start from an empty list so initializing again doesn't queue every tile twice
+        self.tiles = []
         self.init_fullsized_version()
         self.init_downsized_versions()
         self.init_default_tiles()
         if bool(self.custom_tile_boxes):
             self.init_custom_tiles()
+            # A custom box can coincide with a grid or downsized tile; request each distinct tile only once
+            self.tiles = list({t.rel_path: t for t in self.tiles}.values())
         self.initialized = True
 
-    def create(self) -> None:
+    def create(
+        self,
+        session: Optional[requests.Session] = None,
+        max_workers: int = 8,
+        refresh: bool = False,
+    ) -> None:
         if not self.initialized:
             logging.warning(
                 f"Image {self.identifier} has not had its children tiles initialized yet"
             )
-        self.prune()
-        for tile in tqdm(self.tiles, leave=False):
-            tile.create()
+        download_tiles(
+            self.tiles_to_download(refresh=refresh),
+            session=session,
+            max_workers=max_workers,
+            refresh=refresh,
+        )
+        self.write_manifest()
+
+    def tiles_to_download(self, refresh: bool = False) -> list[IIIFTile]:
+        """
+        Prune stray tiles and return those that still need downloading: the missing ones, or every tile when refreshing.
+        """
+        # Walk the image directory once, sharing the result between prune and the missing-tile check
+        partials: list[str] = []
+        existing = self.existing_tiles(partials)
+        self.prune(existing, partials)
+        return self.tiles if refresh else self.missing_tiles(existing)
 
     def make_dir(self) -> None:
         self.path.mkdir(parents=True, exist_ok=True)
 
+    def existing_tiles(self, partials: Optional[list[str]] = None) -> set[str]:
+        """
+        Relative paths of all tile images already on disk for this image. If a partials list is given, the relative paths of any temporary .part files found along the way are appended to it.
+
+        Uses a single os.scandir walk of the image directory rather than one stat() call per tile.
+        """
+        root = os.fspath(self.path)
+        existing: set[str] = set()
+        dirs: list[str] = [""]
+        while dirs:
+            rel_dir = dirs.pop()
+            try:
+                entries = os.scandir(os.path.join(root, rel_dir))
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel_entry = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(rel_entry)
+                    elif entry.name.endswith(".jpg"):
+                        existing.add(rel_entry)
+                    elif partials is not None and entry.name.endswith(".part"):
+                        partials.append(rel_entry)
+        return existing
+
+    def missing_tiles(self, existing: Optional[set[str]] = None) -> list[IIIFTile]:
+        if existing is None:
+            existing = self.existing_tiles()
+        return [t for t in self.tiles if t.rel_path not in existing]
+
     def n_files_to_create(self) -> int:
-        return sum([not tile.exists for tile in self.tiles])
+        return len(self.missing_tiles())
+
+
+def download_tiles(
+    tiles: list[IIIFTile],
+    session: Optional[requests.Session] = None,
+    max_workers: int = 8,
+    refresh: bool = False,
+) -> None:
+    """
+    Download tiles in parallel. Each tile is an independent, network-bound request, so threads overlap the waiting on the IIIF endpoint.
+
+    Without refresh, tiles are expected to be missing already (see IIIFImage.tiles_to_download) and are downloaded unconditionally. With refresh, tiles already on disk are revalidated against the endpoint instead.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        wait_for_tiles(pool, submit_tiles(pool, tiles, session, refresh))
+
+
+def submit_tiles(
+    pool: ThreadPoolExecutor,
+    tiles: list[IIIFTile],
+    session: Optional[requests.Session] = None,
+    refresh: bool = False,
+) -> list[Future]:
+    if refresh:
+        return [pool.submit(tile.create, session, refresh) for tile in tiles]
+    # Without refresh, tiles were already filtered against a directory walk, so skip create()'s per-tile stat
+    return [pool.submit(tile.fetch, session) for tile in tiles]
+
+
+def log_tile_count(n_tiles: int, refresh: bool = False) -> None:
+    # When refreshing, most queued tiles already exist and are only revalidated
+    action = "Creating or revalidating" if refresh else "Creating"
+    logging.info(f"{action} {n_tiles} tiles")
+
+
+def wait_for_tiles(pool: ThreadPoolExecutor, futures: list[Future]) -> None:
+    try:
+        for future in progress(as_completed(futures), total=len(futures)):
+            future.result()
+    except BaseException:
+        # Fail fast instead of waiting for every queued download to run first
+        pool.shutdown(cancel_futures=True)
+        raise
+
+
+def fetch_infos(
+    pool: ThreadPoolExecutor,
+    images: list[IIIFImage],
+    session: Optional[requests.Session] = None,
+) -> Iterator[IIIFImage]:
+    """
+    Request every image's info.json on the pool at once rather than one round trip after another, yielding each image as soon as its info is loaded.
+    """
+    futures = {pool.submit(image.get_info, session): image for image in images}
+    for future in as_completed(futures):
+        future.result()
+        yield futures[future]
 
 
 class CustomTileSpec(BaseModel):
     url: AnyUrl
     identifier: str
-    custom_tiles: list[BBox] = []
+    custom_tiles: list[BBox] = Field(default_factory=list)
 
 
 class ZeroOutConfig(BaseModel):
@@ -362,12 +679,20 @@ class ZeroOutConfig(BaseModel):
         default=0.0,
         description="Seconds to sleep between requesting tiles from the IIIF endpoint.",
     )
-    _urls: list[CustomTileSpec] = PrivateAttr(default=[])
+    concurrency: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum number of tiles to download from the IIIF endpoint at once.",
+    )
+    refresh: bool = Field(
+        default=False,
+        description="Re-request tiles that already exist, replacing only those the IIIF endpoint reports as modified since they were written.",
+    )
+    _urls: list[CustomTileSpec] = PrivateAttr(default_factory=list)
 
     def read_urls(self):
-        with open(self.targets, "r") as target_file:
-            specs_list: list[dict] = json.load(target_file)
-            self._urls = [CustomTileSpec(**d) for d in specs_list]
+        specs_list: list[dict] = json_loads(self.targets.read_bytes())
+        self._urls = [CustomTileSpec(**d) for d in specs_list]
 
 
 class ZeroConverter(BaseModel):
@@ -376,18 +701,37 @@ class ZeroConverter(BaseModel):
     """
 
     config: ZeroOutConfig
-    _images: list[IIIFImage] = PrivateAttr(default=[])
+    _images: list[IIIFImage] = PrivateAttr(default_factory=list)
+    _session: requests.Session = PrivateAttr()
+
+    def __init__(self, **data) -> None:
+        super().__init__(**data)
+        # One pooled connection per download worker
+        self._session = new_session(pool_maxsize=self.config.concurrency)
 
     def clean(self) -> None:
         """
-        Clean the entire directory
+        Clean the directory of every target image, leaving anything else in the output directory alone
         """
-        shutil.rmtree(self.path)
+        self.read_urls()
+        for spec in self.config._urls:
+            image_path = self.config.output / spec.identifier
+            if image_path.exists():
+                shutil.rmtree(image_path)
+
+    def close(self) -> None:
+        """
+        Close the pooled connections to the IIIF endpoint
+        """
+        self._session.close()
 
     def read_urls(self) -> None:
         self.config.read_urls()
 
-    def initialize_images(self) -> None:
+    def load_images(self) -> None:
+        """
+        Read the target specs and build an uninitialized IIIFImage for each
+        """
         assert len(self._images) == 0
         self._images.clear()
         self.read_urls()
@@ -402,8 +746,18 @@ class ZeroConverter(BaseModel):
             )
             self._images.append(img)
 
-        for image in tqdm(self._images, leave=False):
-            image.initialize_children()
+    def initialize_images(self) -> None:
+        self.load_images()
+        with ThreadPoolExecutor(max_workers=self.config.concurrency) as pool:
+            try:
+                for image in progress(
+                    fetch_infos(pool, self._images, session=self._session),
+                    total=len(self._images),
+                ):
+                    image.init_children()
+            except BaseException:
+                pool.shutdown(cancel_futures=True)
+                raise
 
     def n_files_to_create(self) -> int:
         return sum([image.n_files_to_create() for image in self._images])
@@ -416,6 +770,49 @@ class ZeroConverter(BaseModel):
         return [i for i in self._images if not i.is_complete]
 
     def create(self) -> None:
-        logging.info(f"Creating {self.n_files_to_create()} tiles")
-        for image in tqdm(self.incomplete_images, leave=False):
-            image.create()
+        refresh = self.config.refresh
+        tiles: list[IIIFTile] = []
+        for image in self._images:
+            tiles.extend(image.tiles_to_download(refresh=refresh))
+        log_tile_count(len(tiles), refresh)
+        # Share one pool across all images rather than working through them one at a time
+        download_tiles(
+            tiles,
+            session=self._session,
+            max_workers=self.config.concurrency,
+            refresh=refresh,
+        )
+        self.write_manifests()
+
+    def write_manifests(self) -> None:
+        for image in self._images:
+            image.write_manifest()
+
+    def run(self) -> None:
+        """
+        Initialize every image and download its tiles in one pass. All info.json requests are queued first, and each image's tiles are queued for download as soon as its info.json is available, so tile downloads overlap the remaining info.json requests instead of waiting for all of them.
+        """
+        self.load_images()
+        refresh = self.config.refresh
+        with ThreadPoolExecutor(max_workers=self.config.concurrency) as pool:
+            futures: list[Future] = []
+            try:
+                for image in progress(
+                    fetch_infos(pool, self._images, session=self._session),
+                    total=len(self._images),
+                ):
+                    image.init_children()
+                    futures.extend(
+                        submit_tiles(
+                            pool,
+                            image.tiles_to_download(refresh=refresh),
+                            session=self._session,
+                            refresh=refresh,
+                        )
+                    )
+            except BaseException:
+                pool.shutdown(cancel_futures=True)
+                raise
+            log_tile_count(len(futures), refresh)
+            wait_for_tiles(pool, futures)
+        self.write_manifests()
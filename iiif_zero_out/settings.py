@@ -4,6 +4,13 @@ from pydantic import BaseSettings
 class Settings(BaseSettings):
     BASE_SCALING_FACTORS: list[int] = [1, 2, 4, 8, 16, 32, 64, 128, 256]
     BASE_SMALLER_SIZES: list[int] = [16, 32, 64, 128, 256, 512]
+    # (connect, read) timeouts in seconds for requests to the source IIIF endpoint
+    TIMEOUT: tuple[float, float] = (5.0, 30.0)
+    # Retries for connection errors and 429/5xx responses, with exponential backoff in seconds
+    RETRIES: int = 6
+    RETRY_BACKOFF: float = 0.5
+    # Buffer size in bytes when streaming downloaded tiles to disk
+    CHUNK_SIZE: int = 64 * 1024
 
 
 settings = Settings()
@@ -1,10 +1,23 @@
 import json
+from dataclasses import FrozenInstanceError
+from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Iterator, Optional
 
 import pytest
+from requests import Response
+from urllib3 import HTTPResponse
 
-from iiif_zero_out.models import BBox, IIIFTile, IIIFImage, ZeroConverter, ZeroOutConfig
+from iiif_zero_out.main import runner
+from iiif_zero_out.models import (
+    BBox,
+    IIIFTile,
+    IIIFImage,
+    ZeroConverter,
+    ZeroOutConfig,
+    tile_spans,
+)
 
 
 class TestBBox:
@@ -28,6 +41,19 @@ class TestBBox:
         assert b.url == "10,40,45,60/20,30"
         assert b.path == Path("10,40,45,60/20,30")
 
+    def test_bbox_frozen(self):
+        b = BBox(region_x=10, region_y=40, region_w=45, region_h=60)
+        assert b.url == "10,40,45,60/full"
+        with pytest.raises(FrozenInstanceError):
+            b.size_w = 20
+        assert b == BBox(region_x=10, region_y=40, region_w=45, region_h=60)
+
+    def test_bbox_size_string_shared(self):
+        b1 = BBox(region_x=0, region_y=0, region_w=256, region_h=256, size_w=256)
+        b2 = BBox(region_x=256, region_y=0, region_w=256, region_h=256, size_w=256)
+        assert b1.size_string == "256,"
+        assert b1.size_string is b2.size_string
+
 
 @pytest.fixture
 def specs() -> list[dict]:
@@ -59,6 +85,34 @@ def tmp_dir() -> Path:
         yield Path(tmpdir)
 
 
+OLD_LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+NEW_LAST_MODIFIED = "Wed, 01 Jan 2020 00:00:00 GMT"
+
+
+class StubSession:
+    """
+    Stands in for a requests.Session, answering every GET with one canned response
+    """
+
+    def __init__(
+        self, status_code: int, body: bytes = b"", last_modified: Optional[str] = None
+    ) -> None:
+        self.status_code = status_code
+        self.body = body
+        self.last_modified = last_modified
+        self.headers: Optional[dict] = None
+
+    def get(self, url: str, headers: Optional[dict] = None, **kwargs) -> Response:
+        self.headers = headers
+        response = Response()
+        response.status_code = self.status_code
+        response.url = url
+        response.raw = HTTPResponse(body=BytesIO(self.body), preload_content=False)
+        if self.last_modified is not None:
+            response.headers["Last-Modified"] = self.last_modified
+        return response
+
+
 @pytest.fixture
 def tile(tmp_dir, specs) -> IIIFTile:
     outdir_path = tmp_dir / specs[0]["identifier"]
@@ -90,6 +144,39 @@ class TestTile:
         assert target_path.exists()
         assert tile.exists
 
+    def test_tile_create_failure(self, tmp_dir):
+        tile = IIIFTile(
+            image_source_url="https://media.nga.gov/iiif/public/objects/nothere.ptif",
+            image_path=tmp_dir / "nothere.ptif",
+            bbox=BBox(),
+        )
+        with pytest.raises(Exception):
+            tile.create()
+        assert tile.exists is False
+        assert (tmp_dir / "nothere.ptif").exists() is False
+
+    def test_tile_refresh_not_modified(self, tile):
+        tile.create(session=StubSession(200, b"old", OLD_LAST_MODIFIED))
+        before = tile.path.stat()
+        assert before.st_mtime == 1445412480
+        session = StubSession(304)
+        tile.create(session=session, refresh=True)
+        assert session.headers == {"If-Modified-Since": OLD_LAST_MODIFIED}
+        after = tile.path.stat()
+        assert (after.st_ino, after.st_mtime) == (before.st_ino, before.st_mtime)
+        assert tile.path.read_bytes() == b"old"
+        assert list(tile.dir.iterdir()) == [tile.path]
+
+    def test_tile_refresh_modified(self, tile):
+        tile.create(session=StubSession(200, b"old", OLD_LAST_MODIFIED))
+        before = tile.path.stat()
+        tile.create(session=StubSession(200, b"new", NEW_LAST_MODIFIED), refresh=True)
+        after = tile.path.stat()
+        assert tile.path.read_bytes() == b"new"
+        assert after.st_ino != before.st_ino
+        assert after.st_mtime == 1577836800
+        assert list(tile.dir.iterdir()) == [tile.path]
+
     def test_tile_clean(self, tile):
         assert tile.exists is False
         tile.create()
@@ -141,10 +228,60 @@ class TestImage:
         assert image.info_path.exists() is False
         image.get_info()
         assert image.info_path.exists() is True
+        assert list(image.path.glob("*.part")) == []
         assert image.info["width"] == 487
         assert image.info["height"] == 640
         assert image.info["@id"] == "http://localhost/30815-primary-0-nativeres.ptif"
 
+    def test_iiif_image_translate_info(self, image):
+        info = image.translate_info({"width": 487, "height": 640, "maxWidth": 400})
+        assert info["@id"] == "http://localhost/30815-primary-0-nativeres.ptif"
+        assert info["profile"][0] == "http://iiif.io/api/image/2/level0.json"
+        assert info["tiles"] == [{"scaleFactors": [1], "width": 256}]
+        assert info["maxWidth"] == 400
+        assert "maxHeight" not in info
+        other = image.translate_info({"width": 487, "height": 640})
+        info["profile"][1]["formats"].append("png")
+        assert other["profile"][1]["formats"] == ["jpg"]
+
+    def test_iiif_image_dims(self, image):
+        with pytest.raises(Exception):
+            image.min_dim
+        image.info = {"width": 487, "height": 640}
+        assert image.min_dim == 487
+        assert image.max_dim == 640
+        image.info["width"] = 800
+        assert image.min_dim == 640
+        assert image.max_dim == 800
+
+    def test_iiif_image_info_supplied(self, tmp_dir, specs):
+        image = IIIFImage(
+            converter_domain="http://localhost",
+            converter_path=tmp_dir,
+            source_url=specs[0]["url"],
+            identifier=specs[0]["identifier"],
+            tile_size=256,
+            info={"width": 487, "height": 640},
+        )
+        assert image.min_dim == 487
+        image.initialize_children()
+        assert image.initialized
+        assert any(["0,0,256,256/256," in t.url for t in image.tiles])
+
+    def test_iiif_image_info_assigned(self, image):
+        image.info = {"width": 487, "height": 640}
+        image.init_default_tiles()
+        assert image.max_dim == 640
+        assert bool(image.tiles)
+
+    def test_iiif_image_info_after_clean(self, image):
+        image.get_info()
+        image.clean()
+        assert image.info_exists is False
+        image.get_info()
+        assert image.info_path.exists()
+        assert image.info["width"] == 487
+
     def test_iiif_image_fullsize_init(self, image):
         assert bool(image.tiles) is False
         image.get_info()
@@ -193,6 +330,24 @@ class TestImage:
             t.url for t in image.tiles
         ]
 
+    def test_scaling_and_downsizing_levels(self):
+        assert IIIFImage.get_scaling_factors(min_dim=487, tile_size=128) == (1, 2)
+        assert IIIFImage.get_scaling_factors(min_dim=100, tile_size=128) == ()
+        assert IIIFImage.get_downsizing_levels(width=100) == (16, 32, 64)
+        assert IIIFImage.get_downsizing_levels(width=5000) == (
+            16,
+            32,
+            64,
+            128,
+            256,
+            512,
+        )
+
+    def test_tile_spans(self):
+        assert tile_spans(640, 256) == [(0, 256), (256, 256), (512, 128)]
+        assert tile_spans(512, 256) == [(0, 256), (256, 256)]
+        assert tile_spans(100, 256) == [(0, 100)]
+
     def test_iiif_image_default_tiles_create(self, image, specs):
         assert bool(image.tiles) is False
         image.get_info()
@@ -223,6 +378,56 @@ class TestImage:
             ["10,40,45,60/20,30" in str(p.path) for p in image_with_custom.tiles]
         )
 
+    def test_iiif_image_duplicate_custom_tiles(self, image):
+        image.custom_tile_boxes = [
+            BBox(region_x=0, region_y=0, region_w=256, region_h=256, size_w=256),
+            BBox(size_w=64),
+        ]
+        image.initialize_children()
+        rel_paths = [t.rel_path for t in image.tiles]
+        assert len(rel_paths) == len(set(rel_paths))
+        assert "0,0,256,256/256,/0/default.jpg" in rel_paths
+        assert "full/64,/0/default.jpg" in rel_paths
+
+    def test_iiif_image_existing_tiles(self, image):
+        image.init_fullsized_version()
+        assert image.existing_tiles() == set()
+        assert image.n_files_to_create() == 1
+        tile = image.tiles[0]
+        tile.dir.mkdir(parents=True)
+        tile.path.write_bytes(b"")
+        assert image.existing_tiles() == {"full/full/0/default.jpg"}
+        assert image.n_files_to_create() == 0
+
+    def test_iiif_image_prune(self, image):
+        image.init_fullsized_version()
+        stray = image.path / "full/16,/0/default.jpg"
+        for p in [image.tiles[0].path, stray]:
+            p.parent.mkdir(parents=True)
+            p.write_bytes(b"")
+        image.prune()
+        assert image.tiles[0].exists
+        assert stray.exists() is False
+
+    def test_iiif_image_reinitialize(self, image_with_custom):
+        image_with_custom.initialize_children()
+        rel_paths = [t.rel_path for t in image_with_custom.tiles]
+        image_with_custom.initialize_children()
+        assert [t.rel_path for t in image_with_custom.tiles] == rel_paths
+        assert len(rel_paths) == len(set(rel_paths))
+
+    def test_iiif_image_prune_partials(self, image):
+        image.init_fullsized_version()
+        stale = [
+            image.path / "full/full/0/default.jpg.1234-5678.part",
+            image.path / "info.json.part",
+        ]
+        for p in stale:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_bytes(b"")
+        assert image.tiles_to_download() == image.tiles
+        assert all(p.exists() is False for p in stale)
+
     def test_iiif_image_partial(self, image):
         image.initialize_children()
         n_to_create = image.n_files_to_create()
@@ -271,13 +476,17 @@ def large_configs(tmp_dir: Path, config_json: Path) -> ZeroOutConfig:
 
 
 @pytest.fixture
-def converter(configs: ZeroOutConfig) -> ZeroConverter:
-    return ZeroConverter(config=configs)
+def converter(configs: ZeroOutConfig) -> Iterator[ZeroConverter]:
+    converter = ZeroConverter(config=configs)
+    yield converter
+    converter.close()
 
 
 @pytest.fixture
-def large_converter(large_configs: ZeroOutConfig) -> ZeroConverter:
-    return ZeroConverter(config=large_configs)
+def large_converter(large_configs: ZeroOutConfig) -> Iterator[ZeroConverter]:
+    converter = ZeroConverter(config=large_configs)
+    yield converter
+    converter.close()
 
 
 class TestConverter:
@@ -304,3 +513,26 @@ class TestConverter:
         converter.create()
         for image in converter._images:
             assert image.is_complete
+
+    def test_iiif_converter_clean(self, converter, config_json):
+        converter.run()
+        converter.clean()
+        for image in converter._images:
+            assert image.exists is False
+        assert config_json.exists()
+
+    def test_runner_clean(self, tmp_dir, config_json):
+        config = ZeroOutConfig(output=tmp_dir, targets=config_json, clean=True)
+        assert runner(config) == 0
+        assert runner(config) == 0
+        assert (tmp_dir / "30815-primary-0-nativeres.ptif" / "info.json").exists()
+
+    def test_iiif_converter_run(self, converter):
+        converter.run()
+        assert len(converter._images) == 2
+        for image in converter._images:
+            assert image.initialized
+            assert image.is_complete
+            manifest = json.loads(image.manifest_path.read_text())
+            assert manifest["info"] == image.info
+            assert manifest["tiles"] == [t.rel_path for t in image.tiles]